@@ -21,12 +21,60 @@ formats, as well as other utilities commonly used in finance and treasury
 operations.
 """
 
-from .bank_statement_parsers import __init__
-from .camt_parser import CamtParser
-from .pain001_parser import Pain001Parser
+import importlib
 
 __all__ = [
     'CamtParser',
     'Pain001Parser',
     '__init__'
 ]
+
+# The parsers pull in pandas and lxml, so they are imported on first use
+# rather than with the package; this keeps the command line interface's
+# help and usage errors fast.
+_LAZY_IMPORTS = {
+    'CamtParser': '.camt_parser',
+    'Pain001Parser': '.pain001_parser',
+}
+
+# Submodules that were loaded with the package, and so could be reached
+# as its attributes; they are now imported when first accessed.
+_LAZY_SUBMODULES = (
+    'bank_statement_parsers',
+    'camt_parser',
+    'pain001_parser',
+)
+
+
+def __getattr__(name):
+    """
+    Imports the parser classes and submodules on first access (PEP 562).
+
+    Parameters:
+        name (str): The attribute requested from the package.
+
+    Returns:
+        type or module: The requested parser class or submodule.
+
+    Raises:
+        AttributeError: If the package has no such attribute.
+    """
+    if name in _LAZY_SUBMODULES:
+        # Importing a submodule also binds it as a package attribute
+        return importlib.import_module('.' + name, __name__)
+
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        )
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Lists the package attributes, including the lazily imported ones."""
+    return sorted(
+        set(globals()) | set(_LAZY_IMPORTS) | set(_LAZY_SUBMODULES)
+    )
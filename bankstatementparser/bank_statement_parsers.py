@@ -21,9 +21,89 @@ files.
 """
 
 import os
-import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from itertools import chain
 from lxml import etree
+import numpy as np
 import pandas as pd
+from bankstatementparser.xml_utils import (
+    PARSER_OPTIONS, XP_ACCT_ID, iter_elements
+)
+
+# Precompiled XPath expressions, following the conventions described in
+# xml_utils.
+_XP_ADR_LINE = etree.XPath(
+    './*[local-name()="Cdtr"]/*[local-name()="PstlAdr"]'
+    '/*[local-name()="AdrLine"]'
+)
+# Debtor and creditor accounts share one expression; pass the account
+# element name as the $role variable ('DbtrAcct' or 'CdtrAcct').
+_XP_PARTY_ACCT = etree.XPath(
+    './*[local-name()=$role]/*[local-name()="Id"]/*[local-name()="IBAN"]'
+    '|./*[local-name()=$role]/*[local-name()="Id"]'
+    '/*[local-name()="Othr"]/*[local-name()="Id"]'
+)
+_XP_USTRD = etree.XPath(
+    './*[local-name()="RmtInf"]/*[local-name()="Ustrd"]'
+)
+
+
+def _first_text(node, xp, default='', **variables):
+    """
+    Evaluates a compiled XPath once and returns the text of the first match.
+
+    Parameters:
+        node (etree._Element): The element to evaluate the expression on.
+        xp (etree.XPath): The compiled XPath expression.
+        default (str): The value returned when nothing matches.
+        **variables: XPath variables passed through to the expression.
+
+    Returns:
+        str: The text of the first matching element, or the default.
+    """
+    result = xp(node, **variables)
+    return result[0].text if result else default
+
+
+def _local_name(element):
+    """
+    Returns the tag name of an element without its namespace.
+
+    Parameters:
+        element (etree._Element): The element to name.
+
+    Returns:
+        str: The local part of the element's tag.
+    """
+    tag = element.tag
+    return tag[tag.rfind('}') + 1:]
+
+
+def _account_role(element):
+    """
+    Returns the account element an account identifier belongs to.
+
+    Recognises the two identifier layouts matched by _XP_PARTY_ACCT,
+    <role>/Id/IBAN and <role>/Id/Othr/Id.
+
+    Parameters:
+        element (etree._Element): An IBAN or Id element.
+
+    Returns:
+        str: The local name of the owning account element (for example
+        'DbtrAcct'), or None when the element is not an account
+        identifier.
+    """
+    parent = element.getparent()
+    if _local_name(element) == 'Id':
+        if parent is None or _local_name(parent) != 'Othr':
+            return None
+        parent = parent.getparent()
+    if parent is None or _local_name(parent) != 'Id':
+        return None
+    owner = parent.getparent()
+    return _local_name(owner) if owner is not None else None
 
 
 class FileParserError(Exception):
@@ -53,23 +133,17 @@ class Pain001Parser:
         Raises:
             FileNotFoundError: If the specified file cannot be found.
         """
-        # Attempt to open and read the file content.
+        # Open the file in binary mode and let lxml read the bytes straight
+        # from it, without decoding the whole document into a str first.
+        parser = etree.XMLParser(**PARSER_OPTIONS)
         try:
-            with open(file_name, 'r', encoding='utf-8') as f:
-                data = f.read()
+            with open(file_name, 'rb') as f:
+                tree = etree.parse(f, parser).getroot()
         except FileNotFoundError as e:
             raise FileNotFoundError(f"File {file_name} not found!") from e
 
-        # Clean up the XML namespaces to simplify the XPath expressions.
-        data = re.sub('<Document[\\S\\s]*?>', '<Document>', data)
-        data = bytes(data, 'utf-8')
-
-        # Parse the XML content.
-        parser = etree.XMLParser(recover=True, encoding='utf-8')
-        tree = etree.fromstring(data, parser)
-
         # Extract payment batches from the XML tree.
-        self.batches = tree.xpath('.//PmtInf')
+        self.batches = tree.findall('{*}CstmrCdtTrfInitn/{*}PmtInf')
         self.batches_count = len(self.batches)
 
         # Parse payments from each batch.
@@ -92,13 +166,9 @@ class Pain001Parser:
             dict: A dictionary containing header information of the batch.
         """
         # Extract relevant information from the batch header.
-        execution_date = batch.xpath('.//ReqdExctnDt')[0].text
-        debtor_name = batch.xpath('.//Dbtr/Nm')[0].text
-        debtor_account = (
-            batch.xpath('.//DbtrAcct/Id/IBAN|.//DbtrAcct/Id/Othr/Id')[0].text
-            if batch.xpath('.//DbtrAcct/Id/IBAN|.//DbtrAcct/Id/Othr/Id')
-            else ''
-        )
+        execution_date = batch.findtext('{*}ReqdExctnDt')
+        debtor_name = batch.findtext('{*}Dbtr/{*}Nm')
+        debtor_account = _first_text(batch, _XP_PARTY_ACCT, role='DbtrAcct')
 
         return {
             'debtor_name': debtor_name,
@@ -122,7 +192,7 @@ class Pain001Parser:
 
         # Parse each payment in the batch.
         payments = []
-        for payment in batch.xpath('.//CdtTrfTxInf'):
+        for payment in batch.iterfind('{*}CdtTrfTxInf'):
             payment_dict = self._parse_payment(payment)
             payment_dict.update(header)
             payments.append(payment_dict)
@@ -141,23 +211,18 @@ class Pain001Parser:
             dict: A dictionary containing information about the payment.
         """
         # Extract relevant information from the payment.
-        amount = payment.xpath('.//InstdAmt')[0].text
-        currency = payment.xpath('.//InstdAmt/@Ccy')[0]
-        name = payment.xpath('.//Cdtr/Nm')[0].text
-        account = (
-            payment.xpath('.//CdtrAcct/Id/IBAN|.//CdtrAcct/Id/Othr/Id')[0].text
-            if payment.xpath('.//CdtrAcct/Id/IBAN|.//CdtrAcct/Id/Othr/Id')
-            else ''
+        instd_amt = payment.find('{*}Amt/{*}InstdAmt')
+        amount = instd_amt.text
+        currency = instd_amt.get('Ccy')
+        name = payment.findtext('{*}Cdtr/{*}Nm')
+        account = _first_text(payment, _XP_PARTY_ACCT, role='CdtrAcct')
+        country = payment.findtext(
+            '{*}Cdtr/{*}PstlAdr/{*}Ctry', default=''
         )
-        country = (
-            payment.xpath(
-                './/Ctry'
-            )[0].text if payment.xpath('.//Ctry') else ''
+        reference = ' '.join(ref.text or '' for ref in _XP_USTRD(payment))
+        address = ' '.join(
+            line.text or '' for line in _XP_ADR_LINE(payment)
         )
-        references = [ref.text for ref in payment.xpath('.//RmtInf/Ustrd')]
-        reference = ' '.join(references)
-        address_lines = [line.text for line in payment.xpath('.//AdrLine')]
-        address = ' '.join(address_lines)
 
         return {
             'Name': name,
@@ -190,7 +255,9 @@ class Camt053Parser:
         statements (list): A list of dictionaries, each representing a
         statement.
         transactions (list): A list of dictionaries, each representing a
-        transaction.
+        transaction, built from transactions_df on first access.
+        transactions_df (pd.DataFrame): A DataFrame with one row per
+        transaction and the columns listed in TRANSACTION_COLUMNS.
     """
 
     # Balance type definitions.
@@ -200,11 +267,37 @@ class Camt053Parser:
         'CLAV': 'Closing available balance'
     }
 
+    # Transaction columns, in the order _parse_transaction returns them.
+    TRANSACTION_COLUMNS = (
+        'DebtorName',
+        'DebtorAccount',
+        'CreditorName',
+        'CreditorAccount',
+        'Amount',
+        'Currency',
+        'CreditDebit',
+        'Reference',
+        'ValueDate',
+        'BookingDate',
+        'StatementId'
+    )
+
+    # Transaction column types; the low-cardinality codes are stored as
+    # categoricals rather than one Python string per row.
+    TRANSACTION_DTYPES = {
+        'Amount': 'float64',
+        'Currency': 'category',
+        'CreditDebit': 'category'
+    }
+
     def __init__(self, file_name):
         """
         Initializes the parser and parses statements and transactions from the
         given file.
 
+        The file is streamed one statement at a time, so memory use is bound
+        by the size of the largest statement rather than the whole document.
+
         Parameters:
             file_name (str): The path to the CAMT.053 XML file.
 
@@ -213,34 +306,52 @@ class Camt053Parser:
             FileParserError: If the file is not a valid CAMT.053 file or if it
             does not contain any statements.
         """
-        # Attempt to open and read the file content.
+        self.statements = []
+        stmt_columns = []
         try:
-            with open(file_name, 'r', encoding='utf-8') as f:
-                data = f.read()
+            # Stream the statement elements, in any namespace, from the
+            # file; each is freed once it has been parsed.
+            for stmt in iter_elements(file_name, '{*}Stmt'):
+                # Parse transactions once, then summarise them for the
+                # statement.
+                transactions = self._parse_transactions(stmt)
+                self.statements.append(
+                    self._parse_statement(stmt, transactions)
+                )
+                stmt_columns.append(transactions)
         except FileNotFoundError as e:
             raise FileNotFoundError(f"File {file_name} not found!") from e
-
-        # Clean up the XML namespaces to simplify the XPath expressions.
-        data = data.replace(
-            'xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.02"', ''
-        )
-        data = bytes(data, 'utf-8')
-
-        # Parse the XML content.
-        try:
-            parser = etree.XMLParser(recover=True, encoding='utf-8')
-            tree = etree.fromstring(data, parser)
-        except Exception as e:
+        except etree.XMLSyntaxError as e:
             raise FileParserError('Not a valid CAMT.053 file') from e
 
-        # Extract statement elements from the XML tree.
-        stmt_list = tree.xpath('.//Stmt')
-        if not stmt_list:
+        if not self.statements:
             raise FileParserError('No statements found in the CAMT.053 file')
 
-        # Parse statements and transactions.
-        self.statements = self._parse_statements(stmt_list)
-        self.transactions = self._parse_transactions(stmt_list)
+        # Build the transactions DataFrame once, column by column.
+        columns = {
+            name: list(chain.from_iterable(c[name] for c in stmt_columns))
+            for name in self.TRANSACTION_COLUMNS if name != 'Amount'
+        }
+        columns['Amount'] = np.concatenate(
+            [c['Amount'] for c in stmt_columns]
+        )
+        self.transactions_df = pd.DataFrame(
+            columns, columns=self.TRANSACTION_COLUMNS
+        ).astype(self.TRANSACTION_DTYPES)
+
+    @cached_property
+    def transactions(self):
+        """
+        The transactions as a list of dictionaries, built on first access.
+
+        Returns:
+            list: A dictionary per transaction, keyed by
+            TRANSACTION_COLUMNS; missing values are None.
+        """
+        # Missing values are NaN in the DataFrame's string columns; give
+        # them back as None, as in the parsed XML
+        df = self.transactions_df
+        return df.astype(object).where(df.notna(), None).to_dict('records')
 
     def _parse_statement_header(self, stmt):
         """
@@ -254,11 +365,9 @@ class Camt053Parser:
             dict: A dictionary containing header information of the statement.
         """
         # Extract relevant information from the statement header.
-        account_id = stmt.xpath('./Acct/Id/IBAN|./Acct/Id/Othr/Id')[0].text
-        name = stmt.xpath(
-            './Acct/Nm'
-        )[0].text if stmt.xpath('./Acct/Nm') else ''
-        stmt_id = stmt.xpath('./Id')[0].text
+        account_id = XP_ACCT_ID(stmt)[0].text
+        name = stmt.findtext('{*}Acct/{*}Nm', default='')
+        stmt_id = stmt.findtext('{*}Id')
 
         return {
             'StatementId': stmt_id,
@@ -278,11 +387,11 @@ class Camt053Parser:
             dict: A dictionary containing balance information of the statement.
         """
         balances = {}
-        for bal in stmt.xpath('.//Bal'):
-            code = bal.xpath('.//Cd')[0].text
+        for bal in stmt.iterfind('{*}Bal'):
+            code = bal.findtext('{*}Tp/{*}CdOrPrtry/{*}Cd')
             desc = self.DEFINITIONS.get(code, 'Unknown code')
-            amount = float(bal.xpath('.//Amt')[0].text)
-            cdt_dbt = bal.xpath('.//CdtDbtInd')[0].text
+            amount = float(bal.findtext('{*}Amt'))
+            cdt_dbt = bal.findtext('{*}CdtDbtInd')
             if cdt_dbt == 'DBIT':
                 amount *= -1
             balances[code] = {
@@ -291,43 +400,40 @@ class Camt053Parser:
             }
         return balances
 
-    def _parse_statement_summary(self, stmt):
+    def _parse_statement_summary(self, transactions):
         """
-        Parses summary statistics for a bank statement.
+        Computes summary statistics for a bank statement.
 
         Parameters:
-            stmt (etree._Element): The XML element representing a bank
-            statement.
+            transactions (dict): The parsed transaction columns belonging to
+            the statement.
 
         Returns:
             dict: A dictionary containing summary statistics of the statement.
         """
-        transactions = self._parse_transactions([stmt])
-        total = sum(t['Amount'] for t in transactions)
+        amounts = transactions['Amount']
         return {
-            'NumTransactions': len(transactions),
-            'TotalAmount': total
+            'NumTransactions': len(amounts),
+            'TotalAmount': float(amounts.sum())
         }
 
-    def _parse_statements(self, stmt_list):
+    def _parse_statement(self, stmt, transactions):
         """
-        Parses a list of bank statement elements.
+        Parses a single bank statement element.
 
         Parameters:
-            stmt_list (list of etree._Element): A list of XML elements, each
-            representing a bank statement.
+            stmt (etree._Element): The XML element representing a bank
+            statement.
+            transactions (dict): The transaction columns already parsed from
+            stmt, used to build the statement's summary.
 
         Returns:
-            list: A list of dictionaries, each representing a bank statement.
+            dict: A dictionary representing the bank statement.
         """
-        statements = []
-        for stmt in stmt_list:
-            header = self._parse_statement_header(stmt)
-            balances = self._parse_statement_balances(stmt)
-            summary = self._parse_statement_summary(stmt)
-            stmt_data = {**header, **balances, **summary}
-            statements.append(stmt_data)
-        return statements
+        header = self._parse_statement_header(stmt)
+        balances = self._parse_statement_balances(stmt)
+        summary = self._parse_statement_summary(transactions)
+        return {**header, **balances, **summary}
 
     def _parse_transaction(self, entry):
         """
@@ -338,72 +444,104 @@ class Camt053Parser:
             entry.
 
         Returns:
-            dict: A dictionary containing information about the transaction.
+            tuple: The transaction's values, in TRANSACTION_COLUMNS order
+            without the trailing StatementId.
         """
-        # Extract relevant information from the transaction entry.
-        debtor_name = entry.xpath(
-            './/Dbtr/Nm'
-        )[0].text if entry.xpath('.//Dbtr/Nm') else ''
-        debtor_acct = entry.xpath(
-            './/DbtrAcct/Id/IBAN|.//DbtrAcct/Id/Othr/Id'
-        )[0].text if entry.xpath(
-            './/DbtrAcct/Id/IBAN|.//DbtrAcct/Id/Othr/Id'
-        ) else ''
-        creditor_name = entry.xpath(
-            './/Cdtr/Nm'
-        )[0].text if entry.xpath('.//Cdtr/Nm') else ''
-        creditor_acct = entry.xpath(
-            './/CdtrAcct/Id/IBAN|.//CdtrAcct/Id/Othr/Id'
-        )[0].text if entry.xpath(
-            './/CdtrAcct/Id/IBAN|.//CdtrAcct/Id/Othr/Id'
-        ) else ''
-        amount = float(entry.xpath('./Amt')[0].text)
-        currency = entry.xpath('./Amt/@Ccy')[0]
-        cdt_dbt = entry.xpath('./CdtDbtInd')[0].text
-        if cdt_dbt == 'DBIT':
-            amount *= -1
-        references = [ref.text for ref in entry.xpath('.//RmtInf/Ustrd')]
+        debtor_name = creditor_name = None
+        debtor_acct = creditor_acct = None
+        amt = cdt_dbt = value_date = booking_date = None
+        references = []
+
+        # Walk the entry subtree once, in document order, and pick each
+        # field out by its element name and its parents. Only the first
+        # match of a field is kept, as the former per-field lookups did.
+        for el in entry.iter(etree.Element):
+            name = _local_name(el)
+            parent = el.getparent()
+            if parent is entry:
+                if name == 'Amt' and amt is None:
+                    amt = el
+                elif name == 'CdtDbtInd' and cdt_dbt is None:
+                    cdt_dbt = el.text or ''
+            elif name == 'Nm':
+                owner = _local_name(parent)
+                if owner == 'Dbtr' and debtor_name is None:
+                    debtor_name = el.text or ''
+                elif owner == 'Cdtr' and creditor_name is None:
+                    creditor_name = el.text or ''
+            elif name == 'Ustrd':
+                if _local_name(parent) == 'RmtInf':
+                    references.append(el.text or '')
+            elif name == 'Dt':
+                if parent.getparent() is entry:
+                    owner = _local_name(parent)
+                    if owner == 'ValDt' and value_date is None:
+                        value_date = el.text or ''
+                    elif owner == 'BookgDt' and booking_date is None:
+                        booking_date = el.text or ''
+            elif name == 'IBAN' or name == 'Id':
+                # Accounts are wrapped in a tuple so that an empty first
+                # match (text None) still counts as found.
+                role = _account_role(el)
+                if role == 'DbtrAcct' and debtor_acct is None:
+                    debtor_acct = (el.text,)
+                elif role == 'CdtrAcct' and creditor_acct is None:
+                    creditor_acct = (el.text,)
+
+        debtor_name = debtor_name or ''
+        creditor_name = creditor_name or ''
+        debtor_acct = debtor_acct[0] if debtor_acct else ''
+        creditor_acct = creditor_acct[0] if creditor_acct else ''
+        # The amount is returned as text; _parse_transactions converts and
+        # signs the amounts of a whole statement at once.
+        amount = amt.text
+        currency = amt.get('Ccy')
         reference = ' '.join(references)
-        value_date = entry.xpath(
-            './ValDt/Dt'
-        )[0].text if entry.xpath(
-            './ValDt/Dt'
-        ) else None
-        booking_date = entry.xpath(
-            './BookgDt/Dt'
-        )[0].text if entry.xpath('./BookgDt/Dt') else None
 
-        return {
-            'DebtorName': debtor_name,
-            'DebtorAccount': debtor_acct,
-            'CreditorName': creditor_name,
-            'CreditorAccount': creditor_acct,
-            'Amount': amount,
-            'Currency': currency,
-            'CreditDebit': cdt_dbt,
-            'Reference': reference,
-            'ValueDate': value_date,
-            'BookingDate': booking_date
-        }
+        return (
+            debtor_name,
+            debtor_acct,
+            creditor_name,
+            creditor_acct,
+            amount,
+            currency,
+            cdt_dbt,
+            reference,
+            value_date,
+            booking_date
+        )
 
-    def _parse_transactions(self, stmt_list):
+    def _parse_transactions(self, stmt):
         """
-        Parses all transactions from a list of bank statement elements.
+        Parses all transactions from a bank statement element.
 
         Parameters:
-            stmt_list (list of etree._Element): A list of XML elements, each
-            representing a bank statement.
+            stmt (etree._Element): The XML element representing a bank
+            statement.
 
         Returns:
-            list: A list of dictionaries, each representing a transaction.
+            dict: A dictionary mapping each of TRANSACTION_COLUMNS to the
+            values for every transaction; Amount is a float64 array, the
+            others are lists.
         """
-        transactions = []
-        for stmt in stmt_list:
-            for entry in stmt.xpath('./Ntry'):
-                txn = self._parse_transaction(entry)
-                txn['StatementId'] = stmt.xpath('./Id')[0].text
-                transactions.append(txn)
-        return transactions
+        stmt_id = stmt.findtext('{*}Id')
+        rows = [
+            self._parse_transaction(entry)
+            for entry in stmt.iterfind('{*}Ntry')
+        ]
+
+        # Transpose the rows into parallel column lists.
+        columns = {name: [] for name in self.TRANSACTION_COLUMNS}
+        for name, values in zip(self.TRANSACTION_COLUMNS, zip(*rows)):
+            columns[name] = list(values)
+        columns['StatementId'] = [stmt_id] * len(rows)
+
+        # Convert the amounts in one pass and negate the debits.
+        amounts = np.asarray(columns['Amount'], dtype=np.float64)
+        debits = np.asarray(columns['CreditDebit'], dtype=object) == 'DBIT'
+        amounts[debits] *= -1
+        columns['Amount'] = amounts
+        return columns
 
     def __repr__(self):
         """
@@ -415,16 +553,77 @@ class Camt053Parser:
         return (
             f"Camt053Parser("
             f"statements={len(self.statements)}, "
-            f"transactions={len(self.transactions)})"
+            f"transactions={len(self.transactions_df)})"
         )
 
 
-def process_camt053_folder(folder):
+def _parse_one_file(file_path):
+    """
+    Parses a single CAMT.053 file on behalf of process_camt053_folder.
+
+    Defined at module level so that it can be run in a worker process.
+
+    Parameters:
+        file_path (str): The path to the CAMT.053 file.
+
+    Returns:
+        tuple: The file name, the parsed statements, the transactions
+        DataFrame and an error message, which is None on success.
+    """
+    file_name = os.path.basename(file_path)
+    try:
+        parser = Camt053Parser(file_path)
+    except Exception as e:
+        return file_name, [], None, str(e)
+    return file_name, parser.statements, parser.transactions_df, None
+
+
+def _combine_transactions(frames):
+    """
+    Combines per-file transaction DataFrames into one.
+
+    Every frame has the Camt053Parser.TRANSACTION_COLUMNS schema, so each
+    column is allocated once at its final length and filled slice by
+    slice, instead of letting concat infer and copy it. The column dtypes
+    are then restored, with categories covering the values of every file.
+
+    Parameters:
+        frames (list): The transactions DataFrames, one per parsed file.
+
+    Returns:
+        pd.DataFrame: The transactions of all frames, indexed from 0.
+    """
+    total = sum(len(frame) for frame in frames)
+    columns = {}
+    for name in Camt053Parser.TRANSACTION_COLUMNS:
+        dtype = np.float64 if name == 'Amount' else object
+        column = np.empty(total, dtype=dtype)
+        offset = 0
+        for frame in frames:
+            end = offset + len(frame)
+            column[offset:end] = frame[name].to_numpy(dtype=dtype)
+            offset = end
+        columns[name] = column
+    return pd.DataFrame(columns, copy=False).astype(
+        Camt053Parser.TRANSACTION_DTYPES
+    )
+
+
+def process_camt053_folder(folder, max_workers=1):
     """
     Processes all CAMT.053 files in a specified folder.
 
+    Files are parsed in the calling process unless max_workers allows
+    more than one worker process, in which case each file is parsed in a
+    worker. Under the spawn start method (the default on macOS and
+    Windows) worker processes re-import the caller's main module, so the
+    call must then sit behind an ``if __name__ == '__main__'`` guard.
+
     Parameters:
         folder (str): The path to the folder containing CAMT.053 files.
+        max_workers (int, optional): The maximum number of worker
+        processes. Defaults to 1, which parses the files in the calling
+        process; None uses the number of CPUs.
 
     Returns:
         tuple: A tuple containing three pandas DataFrames:
@@ -432,40 +631,53 @@ def process_camt053_folder(folder):
             - statements_df: A DataFrame with parsed statement data.
             - transactions_df: A DataFrame with parsed transaction data.
     """
-    files_df = []
-    statements_df = pd.DataFrame()
-    transactions_df = pd.DataFrame()
-
-    # Loop through each file in the specified folder.
-    for file_name in os.listdir(folder):
-        file_path = os.path.join(folder, file_name)
-        if os.path.isfile(file_path):
-            try:
-                # Attempt to parse the file.
-                parser = Camt053Parser(file_path)
-
-                # Append parsed data to the respective DataFrames.
-                statement_rows = [s for s in parser.statements]
-                statements_df = pd.concat(
-                    [statements_df, pd.DataFrame(statement_rows)]
-                )
-                transaction_rows = [t for t in parser.transactions]
-                transactions_df = pd.concat(
-                    [transactions_df, pd.DataFrame(transaction_rows)]
-                )
+    file_paths = [
+        os.path.join(folder, file_name) for file_name in os.listdir(folder)
+        if os.path.isfile(os.path.join(folder, file_name))
+    ]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(file_paths))
 
-                # Record the successful processing of the file.
-                files_df.append({
-                    'FileName': file_name,
-                    'Status': 'Success'
-                })
-            except Exception as e:
-                # Record any failures along with the associated error message.
-                files_df.append({
-                    'FileName': file_name,
-                    'Status': f'Failed: {e}'
-                })
-
-    # Convert the list of file statuses to a DataFrame.
+    files_df = []
+    all_statements = []
+    transaction_frames = []
+
+    # Parse the files, in worker processes when more than one is needed.
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_parse_one_file, file_paths))
+    else:
+        results = [_parse_one_file(file_path) for file_path in file_paths]
+
+    for file_name, statements, transactions, error in results:
+        if error is None:
+            # Collect the parsed data; the combined DataFrames are built
+            # once all files have been processed.
+            all_statements.extend(statements)
+            transaction_frames.append(transactions)
+
+            # Record the successful processing of the file.
+            files_df.append({
+                'FileName': file_name,
+                'Status': 'Success'
+            })
+        else:
+            # Record any failures along with the associated error message.
+            files_df.append({
+                'FileName': file_name,
+                'Status': f'Failed: {error}'
+            })
+
+    # Convert the collected rows and file statuses to DataFrames.
     files_df = pd.DataFrame(files_df)
+    statements_df = pd.DataFrame(all_statements)
+    # A single frame already has a fresh RangeIndex, so it is used as is
+    # rather than copied.
+    if not transaction_frames:
+        transactions_df = pd.DataFrame()
+    elif len(transaction_frames) == 1:
+        transactions_df = transaction_frames[0]
+    else:
+        transactions_df = _combine_transactions(transaction_frames)
     return files_df, statements_df, transactions_df
@@ -20,20 +20,49 @@ Provides a class CamtParser for parsing CAMT format bank statement files.
 """
 
 import logging
+from collections import namedtuple
 import pandas as pd
 from lxml import etree
+from bankstatementparser.xml_utils import XP_ACCT_ID, iter_elements
 
 # Configuring the logging
 logger = logging.getLogger(__name__)
 
+# Precompiled XPath expressions, following the conventions described in
+# xml_utils.
+_XP_BAL_DT = etree.XPath(
+    './*[local-name()="Dt"]/*[local-name()="Dt" or local-name()="DtTm"]'
+)
+_XP_USTRD = etree.XPath(
+    './*[local-name()="NtryDtls"]/*[local-name()="TxDtls"]'
+    '/*[local-name()="RmtInf"]/*[local-name()="Ustrd"]'
+)
+
+# Row types for the parsed balances and transactions. Their fields are the
+# DataFrame columns, in order.
+_Balance = namedtuple(
+    '_Balance',
+    ('Amount', 'Currency', 'Code', 'Description', 'DrCr', 'Date',
+     'AccountId')
+)
+_Transaction = namedtuple(
+    '_Transaction',
+    ('Amount', 'Currency', 'DrCr', 'Debtor', 'Creditor', 'Reference',
+     'ValDt', 'BookgDt', 'AccountId')
+)
+
 
 class CamtParser:
     """
     Class to parse CAMT format bank statement files.
 
+    The file is streamed one statement at a time the first time data is
+    requested, so the whole document is never held in memory; the parsed
+    balances, transactions and statistics are kept for later requests. A
+    missing file raises FileNotFoundError at that point.
+
     Attributes:
-        tree (etree.Element): The Element object representing the parsed XML
-        file.
+        file_name (str): Path to the CAMT format statement file.
         definitions (dict): Dictionary mapping balance codes to descriptions.
     """
 
@@ -41,40 +70,15 @@ class CamtParser:
         """
         Initializes the parser with the given file.
 
+        The file is not opened until data is requested.
+
         Parameters:
             file_name (str): Path to the CAMT format statement file.
-
-        Raises:
-            FileNotFoundError: If file does not exist.
-            etree.XMLSyntaxError: If there is an issue parsing the XML.
         """
-        try:
-            # Attempt to open and read the file content
-            with open(file_name, 'r', encoding='utf-8') as f:
-                data = f.read()
-        except FileNotFoundError:
-            logger.error("File %s not found!", file_name)
-            raise
-        except Exception as e:
-            logger.error(
-                "An error occurred while reading the file: %s", str(e))
-            raise
+        self.file_name = file_name
 
-        try:
-            # Remove the namespace from the XML data for easier parsing
-            data = data.replace(
-                ' xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.02"', '')
-            data = bytes(data, 'utf-8')
-
-            # Parse the XML data
-            parser = etree.XMLParser(recover=True, encoding='utf-8')
-            self.tree = etree.fromstring(data, parser)
-        except etree.XMLSyntaxError as e:
-            logger.error("XML syntax error: %s", str(e))
-            raise
-        except Exception as e:
-            logger.error("An error occurred while parsing the XML: %s", str(e))
-            raise
+        # Parsed rows, filled in on first use by _parse_all
+        self._parsed = None
 
         # Define balance codes and their descriptions
         self.definitions = {
@@ -85,86 +89,134 @@ class CamtParser:
             'FWAV': 'Forward Available balance'
         }
 
-    def get_account_balances(self):
+    def _iter_statements(self):
         """
-        Returns a DataFrame with balances by account.
+        Streams the bank statements from the file.
+
+        Each statement is freed, together with everything parsed before it,
+        once the caller moves on to the next one.
+
+        Yields:
+            etree.Element: XML Element representing the statement.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            etree.XMLSyntaxError: If there is an issue parsing the XML.
+        """
+        try:
+            yield from iter_elements(self.file_name, '{*}Stmt')
+        except FileNotFoundError:
+            logger.error("File %s not found!", self.file_name)
+            raise
+        except etree.XMLSyntaxError as e:
+            logger.error("XML syntax error: %s", str(e))
+            raise
+
+    def _parse_all(self):
+        """
+        Parses balances, transactions and statistics in a single pass.
+
+        The statements are streamed once and the parsed rows are kept, so
+        later calls to the get_* methods do not read the file again.
 
         Returns:
-            pd.DataFrame: Dataframe with columns:
-                Amount, Currency, Code, Description, DrCr, Date, AccountId.
+            dict: Lists of rows keyed by 'balances', 'transactions' and
+            'stats'; balances and transactions are named tuples, stats
+            are dictionaries.
         """
-        # Find all bank statements in the XML
-        statements = self.tree.xpath('.//Stmt')
-        balances = []
+        if self._parsed is not None:
+            return self._parsed
 
-        # Iterate through each statement to gather balance information
-        for statement in statements:
-            # Get the balances for the current statement
-            bal_list = self._get_balances_for_statement(statement)
+        balances = []
+        transactions = []
+        stats = []
 
+        # Iterate through each statement once, gathering all three views
+        for statement in self._iter_statements():
             # Get the account ID for the current statement
             account_id = self._get_account_id(statement)
 
-            # Add the account ID to each balance entry
-            for bal in bal_list:
-                bal['AccountId'] = account_id
+            # Get the balances and transactions for the current statement
+            bal_list = self._get_balances_for_statement(statement, account_id)
+            tx_list = self._get_transactions_for_statement(
+                statement, account_id
+            )
+
+            # Summarise the statement from the transactions just parsed
+            stats.append(
+                self._get_statement_stats(statement, account_id, tx_list)
+            )
 
-            # Add the balances to the list
             balances.extend(bal_list)
+            transactions.extend(tx_list)
+
+        self._parsed = {
+            'balances': balances,
+            'transactions': transactions,
+            'stats': stats
+        }
+        return self._parsed
+
+    def get_account_balances(self):
+        """
+        Returns a DataFrame with balances by account.
 
-        # Convert the list of balances to a DataFrame and return
-        return pd.DataFrame(balances)
+        Returns:
+            pd.DataFrame: Dataframe with columns:
+                Amount, Currency, Code, Description, DrCr, Date, AccountId.
+        """
+        return pd.DataFrame.from_records(
+            self._parse_all()['balances'], columns=_Balance._fields
+        )
 
-    def _get_balances_for_statement(self, statement):
+    def _get_balances_for_statement(self, statement, account_id):
         """
         Helper method to extract balances for a single statement.
 
         Parameters:
             statement (etree.Element): XML Element representing the statement.
+            account_id (str): Account ID of the statement.
 
         Returns:
-            list: List of parsed balance dictionaries.
+            list: List of parsed balance records.
         """
         # Find all balance elements in the statement
-        bal_elems = statement.xpath('.//Bal')
+        bal_elems = statement.iterfind('{*}Bal')
         balances = []
 
         # Iterate through each balance element to parse its information
         for bal_elem in bal_elems:
-            balance = self._parse_balance(bal_elem)
+            balance = self._parse_balance(bal_elem, account_id)
             balances.append(balance)
 
         return balances
 
-    def _parse_balance(self, bal_elem):
+    def _parse_balance(self, bal_elem, account_id):
         """
         Parses a single Balance element.
 
         Parameters:
             bal_elem (etree.Element): XML Element representing the balance.
+            account_id (str): Account ID of the statement.
 
         Returns:
-            dict: Parsed balance information.
+            _Balance: Parsed balance information.
         """
         # Extract and process information from the balance element
-        code = bal_elem.xpath('.//Cd')[0].text
+        code = bal_elem.findtext('{*}Tp/{*}CdOrPrtry/{*}Cd')
         description = self.definitions.get(code, 'Unknown code')
-        amount = float(bal_elem.xpath('.//Amt')[0].text)
-        cdt_dbt = bal_elem.xpath('.//CdtDbtInd')[0].text
+        amt = bal_elem.find('{*}Amt')
+        amount = float(amt.text)
+        cdt_dbt = bal_elem.findtext('{*}CdtDbtInd')
         if cdt_dbt == 'DBIT':
             amount = -amount
-        currency = bal_elem.xpath('.//Amt/@Ccy')[0]
-        date = bal_elem.xpath('./Dt/Dt|./Dt/DtTm')[0].text
+        currency = amt.get('Ccy')
+        date = _XP_BAL_DT(bal_elem)[0].text
 
-        # Return the balance information as a dictionary
-        return {
-            'Amount': amount,
-            'Currency': currency,
-            'Code': code,
-            'Description': description,
-            'DrCr': cdt_dbt,
-            'Date': date
-        }
+        # Return the balance information as a record
+        return _Balance(
+            amount, currency, code, description, cdt_dbt, date, account_id
+        )
 
     def get_transactions(self):
         """
@@ -175,101 +227,80 @@ class CamtParser:
                 Amount, Currency, DrCr, Debtor, Creditor, Reference,
                 ValDt, BookgDt, AccountId.
         """
-        # Find all bank statements in the XML
-        statements = self.tree.xpath('.//Stmt')
-        transactions = []
+        return pd.DataFrame.from_records(
+            self._parse_all()['transactions'], columns=_Transaction._fields
+        )
 
-        # Iterate through each statement to gather transaction information
-        for statement in statements:
-            # Get the transactions for the current statement
-            tx_list = self._get_transactions_for_statement(statement)
-
-            # Get the account ID for the current statement
-            account_id = self._get_account_id(statement)
-
-            # Add the account ID to each transaction entry
-            for tx in tx_list:
-                tx['AccountId'] = account_id
-
-            # Add the transactions to the list
-            transactions.extend(tx_list)
-
-        # Convert the list of transactions to a DataFrame and return
-        return pd.DataFrame(transactions)
-
-    def _get_transactions_for_statement(self, statement):
+    def _get_transactions_for_statement(self, statement, account_id):
         """
         Helper method to extract transactions for a single statement.
 
         Parameters:
             statement (etree.Element): XML Element representing the statement.
+            account_id (str): Account ID of the statement.
 
         Returns:
-            list: List of parsed transaction dictionaries.
+            list: List of parsed transaction records.
         """
         # Find all entry elements (transactions) in the statement
-        entries = statement.xpath('./Ntry')
+        entries = statement.iterfind('{*}Ntry')
         transactions = []
 
         # Iterate through each entry to parse its information
         for entry in entries:
-            tx = self._parse_transaction(entry)
+            tx = self._parse_transaction(entry, account_id)
             transactions.append(tx)
 
         return transactions
 
-    def _parse_transaction(self, entry):
+    def _parse_transaction(self, entry, account_id):
         """
         Parses a single Entry element (transaction).
 
         Parameters:
             entry (etree.Element): XML Element representing the entry.
+            account_id (str): Account ID of the statement.
 
         Returns:
-            dict: Parsed transaction information.
+            _Transaction: Parsed transaction information.
         """
         # Extract and process information from the transaction entry
-        debtor = self._get_element_text(entry, './/Dbtr/Nm')
-        creditor = self._get_element_text(entry, './/Cdtr/Nm')
+        parties = '{*}NtryDtls/{*}TxDtls/{*}RltdPties/'
+        debtor = self._get_element_text(entry, parties + '{*}Dbtr/{*}Nm')
+        creditor = self._get_element_text(entry, parties + '{*}Cdtr/{*}Nm')
 
-        references = [ref.text for ref in entry.xpath('.//Ustrd') if ref.text]
+        references = [ref.text for ref in _XP_USTRD(entry) if ref.text]
         reference = ''.join(references)
 
-        amount = float(entry.xpath('./Amt')[0].text)
-        currency = entry.xpath('./Amt/@Ccy')[0]
-        cdt_dbt = entry.xpath('./CdtDbtInd')[0].text
+        amt = entry.find('{*}Amt')
+        amount = float(amt.text)
+        currency = amt.get('Ccy')
+        cdt_dbt = entry.findtext('{*}CdtDbtInd')
         if cdt_dbt == 'DBIT':
             amount = -amount
 
-        value_date = self._get_element_text(entry, './ValDt/Dt')
-        booking_date = self._get_element_text(entry, './BookgDt/Dt')
+        value_date = self._get_element_text(entry, '{*}ValDt/{*}Dt')
+        booking_date = self._get_element_text(entry, '{*}BookgDt/{*}Dt')
 
-        # Return the transaction information as a dictionary
-        return {
-            'Amount': amount,
-            'Currency': currency,
-            'DrCr': cdt_dbt,
-            'Debtor': debtor,
-            'Creditor': creditor,
-            'Reference': reference,
-            'ValDt': value_date,
-            'BookgDt': booking_date
-        }
+        # Return the transaction information as a record
+        return _Transaction(
+            amount, currency, cdt_dbt, debtor, creditor, reference,
+            value_date, booking_date, account_id
+        )
 
-    def _get_element_text(self, parent, xpath):
+    def _get_element_text(self, parent, path):
         """
         Helper method to safely get text content of an XML element.
 
         Parameters:
             parent (etree.Element): Parent XML element.
-            xpath (str): XPath expression to find the child element.
+            path (str): ElementPath expression to find the child element.
 
         Returns:
             str: Text content of the child element if it exists, else an empty
             string.
         """
-        element = parent.xpath(xpath)
-        return element[0].text if element else ''
+        return parent.findtext(path, default='')
 
     def _get_account_id(self, statement):
         """
@@ -282,7 +313,7 @@ class CamtParser:
         Returns:
             str: Account ID.
         """
-        id_elems = statement.xpath('./Acct/Id/IBAN|./Acct/Id/Othr/Id')
+        id_elems = XP_ACCT_ID(statement)
         return id_elems[0].text if id_elems else ''
 
     def get_statement_stats(self):
@@ -293,44 +324,33 @@ class CamtParser:
             pd.DataFrame: Dataframe with columns:
                 AccountId, StatementCreated, NumTransactions, NetAmount.
         """
-        # Find all bank statements in the XML
-        statements = self.tree.xpath('.//Stmt')
-        stats = []
-
-        # Iterate through each statement to gather statistics
-        for statement in statements:
-            stmt_stats = self._get_statement_stats(statement)
-            stats.append(stmt_stats)
+        return pd.DataFrame(self._parse_all()['stats'])
 
-        # Convert the list of statistics to a DataFrame and return
-        return pd.DataFrame(stats)
-
-    def _get_statement_stats(self, statement):
+    def _get_statement_stats(self, statement, account_id, transactions):
         """
         Extracts statistics for a single bank statement.
 
         Parameters:
             statement (etree.Element): XML Element representing the bank
             statement.
+            account_id (str): Account ID of the statement.
+            transactions (list): The statement's parsed transaction
+            records.
 
         Returns:
             dict: Statement statistics.
         """
         # Extract basic information about the statement
-        account_id = self._get_account_id(statement)
-        created = self._get_element_text(statement, './CreDtTm')
+        created = self._get_element_text(statement, '{*}CreDtTm')
 
-        # Get all transactions for the statement and calculate summary
-        # statistics
-        transactions = self._get_transactions_for_statement(statement)
-        tx_df = pd.DataFrame(transactions)
-        net_amount = tx_df['Amount'].sum() if len(tx_df) > 0 else 0
+        # Calculate summary statistics from the parsed transactions
+        net_amount = sum(tx.Amount for tx in transactions)
 
         # Return the statistics as a dictionary
         return {
             'AccountId': account_id,
             'StatementCreated': created,
-            'NumTransactions': len(tx_df),
+            'NumTransactions': len(transactions),
             'NetAmount': net_amount
         }
 
@@ -21,17 +21,22 @@ potential to extend support to other formats.
 
 import argparse
 import os
-import pandas as pd
 import sys
-from bankstatementparser import CamtParser, Pain001Parser
+from functools import cached_property
 
 
 class BankStatementCLI:
     """A command line interface for parsing bank statement files."""
 
-    def __init__(self):
-        """Initialize the CLI by setting up the argument parser."""
-        self.parser = self.setup_arg_parser()
+    @cached_property
+    def parser(self):
+        """
+        The argument parser, built on first use.
+
+        Returns:
+            argparse.ArgumentParser: The configured argument parser.
+        """
+        return self.setup_arg_parser()
 
     def setup_arg_parser(self):
         """
@@ -50,9 +55,31 @@ class BankStatementCLI:
             help='Path to the bank statement file.')
         parser.add_argument(
             '--output', type=str, required=False,
-            help='Path to save parsed data; if not provided, data is printed.')
+            help='Path to save parsed data as CSV, or as Parquet if it ends '
+                 'in ".parquet"; if not provided, data is printed.')
         return parser
 
+    def save_output(self, data_df, output_path):
+        """
+        Save parsed data to a file.
+
+        Paths ending in ".parquet" are written as Parquet, which needs
+        pyarrow or fastparquet to be installed; anything else is written as
+        CSV.
+
+        Args:
+            data_df (pd.DataFrame): The parsed data.
+            output_path (str): Path to save the parsed data to.
+        """
+        if output_path.lower().endswith('.parquet'):
+            data_df.to_parquet(output_path, index=False)
+        else:
+            # Write CSV in chunks of rows through a large buffer, so that a
+            # big table is never serialised in one piece
+            with open(output_path, 'w', buffering=1 << 20, newline='',
+                      encoding='utf-8') as f:
+                data_df.to_csv(f, index=False, chunksize=65536)
+
     def parse_camt(self, file_path, output_path=None):
         """
         Parse a CAMT format bank statement file and print or save the results.
@@ -63,19 +90,23 @@ class BankStatementCLI:
             data is printed to console.
         """
         try:
+            # Imported here so that help and usage errors stay fast
+            import pandas as pd
+            from bankstatementparser import CamtParser
+
             parser = CamtParser(file_path)
             data = parser.get_statement_stats()
-            print("Data returned by get_statement_stats:")
-            print(data)
-            print("Type of data:", type(data))
 
             if isinstance(data, dict):
                 data = [data]
 
-            data_df = pd.DataFrame(data)
+            # The parser already returns a DataFrame; only wrap other data
+            data_df = (
+                data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+            )
 
             if output_path:
-                data_df.to_csv(output_path, index=False)
+                self.save_output(data_df, output_path)
                 print(f"Parsed data saved to {output_path}")
             else:
                 print(data_df)
@@ -94,16 +125,24 @@ class BankStatementCLI:
             data is printed to console.
         """
         try:
+            # Imported here so that help and usage errors stay fast
+            import pandas as pd
+            from bankstatementparser import Pain001Parser
+
             # Instantiate the PAIN.001 parser
             parser = Pain001Parser(file_path)
 
             # Perform the parsing
             parsed_data = parser.parse()
 
-            data_df = pd.DataFrame(parsed_data)
+            # The parser already returns a DataFrame; only wrap other data
+            data_df = (
+                parsed_data if isinstance(parsed_data, pd.DataFrame)
+                else pd.DataFrame(parsed_data)
+            )
 
             if output_path:
-                data_df.to_csv(output_path, index=False)
+                self.save_output(data_df, output_path)
                 print(f"Parsed data saved to {output_path}")
             else:
                 print(data_df)
@@ -117,6 +156,12 @@ class BankStatementCLI:
             self.parser.print_help(sys.stderr)
             sys.exit(1)
 
+        # Answer help requests before validating the other arguments; the
+        # parsers and pandas are only imported once a file is parsed
+        if '-h' in sys.argv[1:] or '--help' in sys.argv[1:]:
+            self.parser.print_help()
+            sys.exit(0)
+
         args = self.parser.parse_args()
 
         if not os.path.isfile(args.input):
@@ -4,104 +4,399 @@
     Provides a class for parsing PAIN.001 format bank statement files.
 """
 
+import errno
 import logging
-from xml.etree.ElementTree import ParseError
+import os
+from functools import cached_property, lru_cache
 import pandas as pd
 from lxml import etree
+from bankstatementparser.xml_utils import PARSER_OPTIONS, iter_elements
 
 # Configuring the logging
 logger = logging.getLogger(__name__)
 
+# Namespace prefix map for querying the parsed tree
+NS = {'p': 'urn:iso:std:iso:20022:tech:xsd:pain.001.001.03'}
+
+# Field paths of the group header and of a payment information record,
+# relative to the record. string() returns '' for a missing element, takes
+# the first account identifier present and also reads the nested Dt of
+# newer ReqdExctnDt elements.
+_GROUP_HEADER_PATHS = {
+    'MsgId': 'string(p:MsgId)',
+    'CreDtTm': 'string(p:CreDtTm)',
+    'NbOfTxs': 'string(p:NbOfTxs)',
+    'InitgPty': 'string(p:InitgPty/p:Nm)'
+}
+_PMT_INF_PATHS = {
+    'PmtInfId': 'string(p:PmtInfId)',
+    'PmtMtd': 'string(p:PmtMtd)',
+    'NbOfTxs': 'string(p:NbOfTxs)',
+    'CtrlSum': 'string(p:CtrlSum)',
+    'ReqdExctnDt': 'string(p:ReqdExctnDt)',
+    'DebtorName': 'string(p:Dbtr/p:Nm)',
+    'DebtorAccount': 'string(p:DbtrAcct/p:Id/p:IBAN'
+                     '|p:DbtrAcct/p:Id/p:Othr/p:Id)'
+}
+
+
+@lru_cache(maxsize=None)
+def _compile_paths(namespace):
+    """
+    Compiles the field paths for the namespace of a message.
+
+    The paths use namespaced name tests, bound to the record's namespace,
+    so that files of any pain.001 version are read alike. Plain strings
+    are returned so that no result keeps a freed record alive.
+
+    Args:
+        namespace (str): The namespace of the records, or None if they
+        have none.
+
+    Returns:
+        tuple: The group header and the payment information expressions,
+        each a dict of compiled XPaths keyed by field name.
+    """
+    if namespace is None:
+        # XPath 1.0 has no prefix for the empty namespace; use bare names
+        namespaces, prefix = None, ''
+    else:
+        namespaces, prefix = {'p': namespace}, 'p:'
+    return tuple(
+        {
+            name: etree.XPath(
+                path.replace('p:', prefix), namespaces=namespaces,
+                smart_strings=False
+            )
+            for name, path in paths.items()
+        }
+        for paths in (_GROUP_HEADER_PATHS, _PMT_INF_PATHS)
+    )
+
+
+# Compile the expressions for the usual namespace up front
+_compile_paths(NS['p'])
+
+
+def _iter_records(file_name, tags):
+    """
+    Streams the top-level records of a credit transfer initiation message.
+
+    Each element is freed, together with everything parsed before it,
+    once the caller moves on to the next one; a caller that stops early
+    leaves the rest of the file unread.
+
+    Args:
+        file_name (str): Path to the PAIN.001 file.
+        tags (tuple): The record tags to stream, such as '{*}GrpHdr'.
+
+    Yields:
+        etree._Element: A record element, still attached to its parent.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    # Bulk payment files can hold text nodes beyond libxml2's default size
+    # limit, so huge_tree lifts it
+    try:
+        for element in iter_elements(file_name, tags, huge_tree=True):
+            # Only records of a credit transfer initiation message count
+            parent = element.getparent()
+            if (parent is not None and
+                    etree.QName(parent).localname == 'CstmrCdtTrfInitn'):
+                yield element
+    except FileNotFoundError:
+        logger.error("File %s not found!", file_name)
+        raise
+
+
+def _parse_group_header(element):
+    """
+    Reads the fields of a GrpHdr element.
+
+    Args:
+        element (etree._Element): The group header element.
+
+    Returns:
+        dict: MsgId, CreDtTm, NbOfTxs and InitgPty (the initiating party's
+        name) of the message.
+    """
+    xpaths = _compile_paths(etree.QName(element).namespace)[0]
+    group_header = {name: xpath(element) for name, xpath in xpaths.items()}
+    logger.debug("Group header: %s", group_header)
+    return group_header
+
+
+def _to_count(values):
+    """
+    Reads transaction counts, keeping only whole numbers.
+
+    Args:
+        values (pd.Series): The counts as text.
+
+    Returns:
+        pd.Series: The counts, missing where a value is not a whole number.
+    """
+    numbers = pd.to_numeric(values, errors='coerce')
+    return numbers.where(numbers % 1 == 0).astype('Int64')
+
+
+def _to_amount(values):
+    """
+    Reads amounts.
+
+    Args:
+        values (pd.Series): The amounts as text.
+
+    Returns:
+        pd.Series: The amounts, missing where a value is not a number.
+    """
+    return pd.to_numeric(values, errors='coerce')
+
+
+def _to_datetime(values):
+    """
+    Reads execution dates.
+
+    They are either dates or datetimes, which usually carry an offset, so
+    all of them are read as UTC.
+
+    Args:
+        values (pd.Series): The dates as ISO 8601 text.
+
+    Returns:
+        pd.Series: The dates in UTC, missing where a value is not a date.
+    """
+    return pd.to_datetime(
+        values, utc=True, format='ISO8601', errors='coerce'
+    )
+
+
+# Converters for the typed payment information columns
+_CONVERTERS = {
+    'NbOfTxs': _to_count,
+    'CtrlSum': _to_amount,
+    'ReqdExctnDt': _to_datetime
+}
+
+
+def _convert_column(name, values, record_ids):
+    """
+    Converts a typed column, logging each value that cannot be read.
+
+    An unreadable value becomes a missing value, so that one bad field
+    does not reject the whole file; a warning names its record.
+
+    Args:
+        name (str): The column name, a key of _CONVERTERS.
+        values (list): The column's text values, None where missing.
+        record_ids (list): The PmtInfId of each record.
+
+    Returns:
+        pd.Series: The converted column.
+    """
+    text = pd.Series(values, dtype=object)
+    converted = _CONVERTERS[name](text)
+    unread = converted.isna() & text.notna()
+    if unread.any():
+        for record_id, value, bad in zip(record_ids, values, unread):
+            if bad:
+                logger.warning(
+                    "Payment information %s: cannot read %s %r",
+                    record_id, name, value
+                )
+    return converted
+
+
+class Pain001ParseError(Exception):
+    """Custom exception for PAIN.001 parsing errors."""
+    pass
+
 
 class Pain001Parser:
     """
     Class to parse PAIN.001 format bank statement files.
+
+    The file is only read when it is first parsed: parse() streams it one
+    payment information record at a time, so memory use does not grow with
+    the size of the file, and keeps the result for later calls. A missing
+    file raises FileNotFoundError at that point.
+
+    Attributes:
+        NS (dict): Namespace prefix map for querying tree.
+        COLUMNS (tuple): The columns of the DataFrame returned by parse(),
+        one row per payment information record.
+        DTYPES (dict): The dtypes of the non-text columns; execution dates
+        are in UTC. A value that cannot be read is missing, and logged.
     """
 
+    NS = NS
+    COLUMNS = tuple(_PMT_INF_PATHS)
+    DTYPES = {
+        'PmtMtd': 'category',
+        'NbOfTxs': 'Int64',
+        'CtrlSum': 'float64',
+        'ReqdExctnDt': 'datetime64[ns, UTC]'
+    }
+
     def __init__(self, file_name):
         """Initialize the parser with the file name.
 
+        The file is not opened until it is parsed.
+
         Args:
             file_name (str): Path to the PAIN.001 file.
         """
         self.file_name = file_name
 
-        try:
-            # Attempt to open and read the file content
-            with open(file_name, 'r', encoding='utf-8') as f:
-                data = f.read()
-        except FileNotFoundError:
-            logger.error("File %s not found!", file_name)
-            raise
-        except Exception as e:
-            logger.error(
-                "An error occurred while reading the file: %s", str(e)
-            )
-            raise
+    @cached_property
+    def tree(self):
+        """The parsed document, built on first access.
+
+        The document keeps its namespace; query it with the NS prefix map,
+        for example ``tree.find('.//p:GrpHdr', Pain001Parser.NS)``.
+
+        Returns:
+            etree._Element: The root element of the document.
 
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            etree.XMLSyntaxError: If there is an issue parsing the XML.
+        """
         try:
-            # Remove the namespace from the XML data for easier parsing
-            data = data.replace(
-                'xmlns="urn:iso:std:iso:20022:tech:xsd:pain.001.001.03"', '')
-            data = bytes(data, 'utf-8')
-
-            # Parse the XML data
-            parser = etree.XMLParser(recover=True, encoding='utf-8')
-            self.tree = etree.fromstring(data, parser)
+            # Let libxml2 read the file directly, without its text size limit
+            parser = etree.XMLParser(huge_tree=True, **PARSER_OPTIONS)
+            return etree.parse(self.file_name, parser).getroot()
         except etree.XMLSyntaxError as e:
             logger.error("XML syntax error: %s", str(e))
             raise
+        except OSError as e:
+            # libxml2 reports a missing file as a plain OSError
+            if os.path.exists(self.file_name):
+                logger.error("Error reading the XML: %s", str(e))
+                raise
+            logger.error("File %s not found!", self.file_name)
+            raise FileNotFoundError(
+                errno.ENOENT, os.strerror(errno.ENOENT), self.file_name
+            ) from e
         except Exception as e:
             logger.error("An error occurred while parsing the XML: %s", str(e))
             raise
 
+    @cached_property
+    def _parsed(self):
+        """
+        Streams the file once, reading the group header and the payment
+        information records.
+
+        Returns:
+            tuple: The group header dictionary and the payment information
+            DataFrame.
+
+        Raises:
+            ValueError: If the file has no credit transfer group header.
+        """
+        group_header = None
+        columns = {name: [] for name in self.COLUMNS}
+
+        # Stream the group header and the payment information records
+        records = _iter_records(self.file_name, ('{*}GrpHdr', '{*}PmtInf'))
+        for element in records:
+            tag = etree.QName(element)
+            if tag.localname == 'GrpHdr':
+                group_header = _parse_group_header(element)
+            else:
+                # Parse the payment information record, column by column
+                xpaths = _compile_paths(tag.namespace)[1]
+                for name, xpath in xpaths.items():
+                    columns[name].append(xpath(element))
+
+        if group_header is None:
+            raise ValueError("No group header found")
+
+        # string() gives '' for a missing field; make it a missing value so
+        # that the typed columns can hold it
+        for name in self.DTYPES:
+            columns[name] = [value or None for value in columns[name]]
+
+        # Convert the typed columns; an unreadable value becomes missing,
+        # with a warning, rather than rejecting the whole file
+        for name in _CONVERTERS:
+            columns[name] = _convert_column(
+                name, columns[name], columns['PmtInfId']
+            )
+
+        # Create DataFrame from parsed data, with the known column types
+        df = pd.DataFrame(columns, copy=False).astype(self.DTYPES)
+        return group_header, df
+
+    @classmethod
+    def read_header(cls, file_name):
+        """
+        Reads only the group header of a PAIN.001 file.
+
+        The header precedes the payment information records, so parsing
+        stops as soon as it has been read.
+
+        Args:
+            file_name (str): Path to the PAIN.001 file.
+
+        Returns:
+            dict: MsgId, CreDtTm, NbOfTxs and InitgPty (the initiating
+            party's name) of the message.
+
+        Raises:
+            ValueError: If the file has no credit transfer group header.
+        """
+        for element in _iter_records(file_name, '{*}GrpHdr'):
+            return _parse_group_header(element)
+        raise ValueError("No group header found")
+
+    @cached_property
+    def group_header(self):
+        """The group header fields.
+
+        Taken from the full parse if it has already run; otherwise only
+        the header is read, with read_header.
+
+        Returns:
+            dict: MsgId, CreDtTm, NbOfTxs and InitgPty (the initiating
+            party's name) of the message.
+        """
+        if '_parsed' in self.__dict__:
+            return self._parsed[0]
+        return self.read_header(self.file_name)
+
+    @property
+    def df(self):
+        """The payment information records, parsed on first access.
+
+        The same DataFrame is returned on every access.
+
+        Returns:
+            pd.DataFrame: One row per record, with the COLUMNS columns.
+        """
+        return self._parsed[1]
+
     def parse(self, output_file=None):
+        """
+        Parses the file, optionally saving the records to a CSV file.
+
+        The file is only read on the first call; later calls return the
+        same DataFrame.
+
+        Args:
+            output_file (str, optional): Path to save the records to.
+
+        Returns:
+            pd.DataFrame: The payment information records.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            Pain001ParseError: If the file cannot be parsed or saved.
+        """
         try:
-            # Get the root element
-            root = self.tree.getroottree().getroot()
-
-            # Get the group header
-            group_header = root.find('.//CstmrCdtTrfInitn/GrpHdr')
-
-            # Get the message identification
-            message_id = group_header.find(
-                'MsgId'
-            ).text if group_header.find('MsgId') is not None else None
-            print("Message Identification:", message_id)
-
-            # Get the creation date and time
-            creation_date_time = group_header.find(
-                'CreDtTm'
-            ).text if group_header.find('CreDtTm') is not None else None
-            print("Creation Date and Time:", creation_date_time)
-
-            # Get the number of transactions
-            number_of_transactions = group_header.find(
-                'NbOfTxs'
-            ).text if group_header.find('NbOfTxs') is not None else None
-            print("Number of Transactions:", number_of_transactions)
-
-            # Get the initiating party
-            initiating_party = group_header.find(
-                './/InitgPty/Nm'
-            ).text if group_header.find('.//InitgPty/Nm') is not None else None
-            print("Initiating Party:", initiating_party)
-
-            # Parse the payment information records
-            payment_info_records = root.findall(
-                './/CstmrCdtTrfInitn/PmtInf'
-            )
-            payments = []
-            for pmt in payment_info_records:
-                payment = {}
-                payment['PmtInfId'] = pmt.find(
-                    'PmtInfId'
-                ).text if pmt.find('PmtInfId') is not None else None
-                # Additional payment information parsing omitted for brevity
-                payments.append(payment)
-
-            # Create DataFrame from parsed data
-            df = pd.DataFrame(payments)
+            df = self.df
 
             if output_file:
                 # Save the parsed DataFrame to a CSV file
@@ -109,5 +404,7 @@ class Pain001Parser:
                 logger.info("Parsed data saved to %s", output_file)
 
             return df
+        except FileNotFoundError:
+            raise
         except Exception as e:
-            raise ParseError(f"Error parsing PAIN.001 file: {e}")
+            raise Pain001ParseError(f"Error parsing PAIN.001 file: {e}") from e
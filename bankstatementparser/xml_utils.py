@@ -0,0 +1,82 @@
+# Copyright (C) 2023 Sebastien Rousseau.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+xml_utils.py
+
+Provides the XML parser options, XPath expressions and streaming helper
+shared by the statement parsers.
+"""
+
+from lxml import etree
+
+# Options shared by every XML parse in the package. Statement files never
+# rely on IDs, entities, comments or processing instructions, so libxml2
+# can skip that bookkeeping; dropping whitespace-only text nodes also
+# leaves fewer nodes for every later lookup to walk.
+PARSER_OPTIONS = {
+    'recover': True,
+    'encoding': 'utf-8',
+    'collect_ids': False,
+    'resolve_entities': False,
+    'no_network': True,
+    'remove_blank_text': True,
+    'remove_comments': True,
+    'remove_pis': True,
+}
+
+# Precompiled XPath expressions, evaluated once per element while parsing.
+# Documents are parsed with their namespace, so element names are matched
+# with local-name() in XPath and with {*} wildcards in ElementPath lookups.
+# Paths are spelled out from the context element, since the schemas fix
+# the depth of every element; '//' would walk the whole subtree.
+
+# The account identifier of a statement: <Acct>/Id/IBAN or
+# <Acct>/Id/Othr/Id.
+XP_ACCT_ID = etree.XPath(
+    './*[local-name()="Acct"]/*[local-name()="Id"]/*[local-name()="IBAN"]'
+    '|./*[local-name()="Acct"]/*[local-name()="Id"]'
+    '/*[local-name()="Othr"]/*[local-name()="Id"]'
+)
+
+
+def iter_elements(source, tag, **options):
+    """
+    Streams the elements with the given tag from an XML file.
+
+    Each element is freed, together with everything parsed before it,
+    once the caller moves on to the next one, so memory use is bound by
+    the size of the largest element rather than the whole document.
+
+    Parameters:
+        source (str): Path to the XML file.
+        tag (str or tuple): The tag or tags to stream, such as '{*}Stmt'.
+        **options: Parser options added to, or overriding, PARSER_OPTIONS.
+
+    Yields:
+        etree._Element: A fully parsed element, still attached to its
+        parent.
+
+    Raises:
+        etree.XMLSyntaxError: If there is an issue parsing the XML.
+    """
+    context = etree.iterparse(
+        source, events=('end',), tag=tag, **{**PARSER_OPTIONS, **options}
+    )
+    for _, element in context:
+        yield element
+        element.clear(keep_tail=True)
+        while element.getprevious() is not None:
+            del element.getparent()[0]
@@ -1,26 +1,30 @@
 import unittest
 import os
+import tempfile
+import pandas as pd
 from bankstatementparser.pain001_parser import Pain001Parser
+from bankstatementparser.pain001_parser import Pain001ParseError
+
+NS = Pain001Parser.NS
 
 
 # Define additional test cases
 class TestPain001Parser(unittest.TestCase):
     """Tests for Pain001Parser"""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         current_dir = os.path.dirname(os.path.abspath(__file__))
         file_path = os.path.join(
             current_dir, 'test_data', 'pain.001.001.03.xml'
         )
-        self.parser = Pain001Parser(file_path)
+        cls.parser = Pain001Parser(file_path)
 
     def testMessageIdentification(self):
         # Test to ensure the parser correctly retrieves the message
         # identification from the XML data
-        group_header = self.parser.tree.find('.//GrpHdr')
-        message_id = group_header.find(
-            'MsgId'
-        ).text if group_header.find('MsgId') is not None else None
+        group_header = self.parser.tree.find('.//p:GrpHdr', NS)
+        message_id = group_header.findtext('p:MsgId', namespaces=NS)
         self.assertEqual(
             message_id, '1', "Message identification not retrieved correctly"
         )
@@ -28,10 +32,10 @@ class TestPain001Parser(unittest.TestCase):
     def testCreationDateTime(self):
         # Test to ensure the parser correctly retrieves the creation date and
         # time from the XML data
-        group_header = self.parser.tree.find('.//GrpHdr')
-        creation_date_time = group_header.find(
-            'CreDtTm'
-        ).text if group_header.find('CreDtTm') is not None else None
+        group_header = self.parser.tree.find('.//p:GrpHdr', NS)
+        creation_date_time = group_header.findtext(
+            'p:CreDtTm', namespaces=NS
+        )
         self.assertEqual(
             creation_date_time,
             '2023-03-10T15:30:47.000Z',
@@ -41,10 +45,10 @@ class TestPain001Parser(unittest.TestCase):
     def testNumberOfTransactions(self):
         # Test to ensure the parser correctly retrieves the number of
         # transactions from the XML data
-        group_header = self.parser.tree.find('.//GrpHdr')
-        number_of_transactions = group_header.find(
-            'NbOfTxs'
-        ).text if group_header.find('NbOfTxs') is not None else None
+        group_header = self.parser.tree.find('.//p:GrpHdr', NS)
+        number_of_transactions = group_header.findtext(
+            'p:NbOfTxs', namespaces=NS
+        )
         self.assertEqual(
             number_of_transactions,
             '2',
@@ -54,9 +58,9 @@ class TestPain001Parser(unittest.TestCase):
     def testInitiatingParty(self):
         # Test to ensure the parser correctly retrieves the initiating party
         # information from the XML data
-        initiating_party = self.parser.tree.find(
-            './/InitgPty/Nm'
-        ).text if self.parser.tree.find('.//InitgPty/Nm') is not None else None
+        initiating_party = self.parser.tree.findtext(
+            './/p:InitgPty/p:Nm', namespaces=NS
+        )
         self.assertEqual(
             initiating_party,
             'John Doe',
@@ -66,13 +70,125 @@ class TestPain001Parser(unittest.TestCase):
     def testPaymentInformationParsing(self):
         # Test scenarios to ensure that the parser correctly parses and
         # processes different payment information records
-        payment_info_records = self.parser.tree.findall('.//PmtInf')
+        payment_info_records = self.parser.tree.findall('.//p:PmtInf', NS)
         self.assertGreaterEqual(
             len(payment_info_records),
             1,
             "Insufficient payment information records"
         )
 
+    def testParse(self):
+        # Test that parse returns one row per payment information record,
+        # with the header fields of each record as columns
+        df = self.parser.parse()
+        self.assertEqual(list(df.columns), list(Pain001Parser.COLUMNS))
+        self.assertEqual(len(df), 6)
+        self.assertEqual(df['PmtInfId'][0], 'Payment-Info-12345')
+        self.assertEqual(df['DebtorName'][0], 'Acme Corp')
+        self.assertEqual(df['DebtorAccount'][0], 'DE75512108001245126162')
+        self.assertEqual(df['NbOfTxs'][0], 2)
+        self.assertEqual(
+            str(df['ReqdExctnDt'].dtype), 'datetime64[ns, UTC]'
+        )
+
+    def testParseIsCached(self):
+        # Test that the file is parsed once and the result reused
+        df = self.parser.parse()
+        self.assertIs(self.parser.parse(), df)
+        self.assertEqual(self.parser.group_header['MsgId'], '1')
+        self.assertEqual(self.parser.group_header['InitgPty'], 'John Doe')
+
+    def testReadHeader(self):
+        # Test that the group header can be read without parsing the
+        # payment information records
+        header = Pain001Parser.read_header(self.parser.file_name)
+        self.assertEqual(header['MsgId'], '1')
+        self.assertEqual(header['NbOfTxs'], '2')
+
+        parser = Pain001Parser(self.parser.file_name)
+        self.assertEqual(parser.group_header, header)
+        self.assertNotIn('_parsed', vars(parser))
+
+    def testParseOtherVersion(self):
+        # Test that a message of another pain.001 version, in its own
+        # namespace, is read like the pain.001.001.03 one
+        file_path = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            'test_data', 'pain.001.001.09.xml'
+        )
+        parser = Pain001Parser(file_path)
+        df = parser.parse()
+        self.assertEqual(parser.group_header['MsgId'], '9')
+        self.assertEqual(parser.group_header['InitgPty'], 'Jane Doe')
+        self.assertEqual(df['PmtInfId'][0], 'Payment-Info-90001')
+        self.assertEqual(df['DebtorAccount'][0], '123456789')
+        self.assertEqual(df['CtrlSum'][0], 75.25)
+
+    def testParseExecutionDateTime(self):
+        # Test that execution datetimes with an offset are read as UTC,
+        # alongside plain execution dates
+        file_path = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            'test_data', 'pain.001.001.09.xml'
+        )
+        df = Pain001Parser(file_path).parse()
+        self.assertEqual(
+            list(df['ReqdExctnDt']),
+            [
+                pd.Timestamp('2023-03-12T00:00:00Z'),
+                pd.Timestamp('2023-03-12T09:00:00Z')
+            ]
+        )
+
+    def testParseUnreadableValues(self):
+        # Test that typed fields that cannot be read become missing values,
+        # each reported with its record, instead of rejecting the file
+        xml = (
+            b'<Document><CstmrCdtTrfInitn>'
+            b'<GrpHdr><MsgId>1</MsgId><NbOfTxs>2</NbOfTxs></GrpHdr>'
+            b'<PmtInf><PmtInfId>P1</PmtInfId><NbOfTxs>x2</NbOfTxs>'
+            b'<CtrlSum>1.5</CtrlSum><ReqdExctnDt>someday</ReqdExctnDt>'
+            b'</PmtInf>'
+            b'<PmtInf><PmtInfId>P2</PmtInfId><NbOfTxs>1</NbOfTxs>'
+            b'<CtrlSum>abc</CtrlSum><ReqdExctnDt>2023-03-12</ReqdExctnDt>'
+            b'</PmtInf>'
+            b'</CstmrCdtTrfInitn></Document>'
+        )
+        with tempfile.NamedTemporaryFile(suffix='.xml') as f:
+            f.write(xml)
+            f.flush()
+            with self.assertLogs(
+                'bankstatementparser.pain001_parser', 'WARNING'
+            ) as logs:
+                df = Pain001Parser(f.name).parse()
+
+        self.assertTrue(pd.isna(df['NbOfTxs'][0]))
+        self.assertEqual(df['NbOfTxs'][1], 1)
+        self.assertEqual(df['CtrlSum'][0], 1.5)
+        self.assertTrue(pd.isna(df['CtrlSum'][1]))
+        self.assertTrue(pd.isna(df['ReqdExctnDt'][0]))
+        self.assertEqual(
+            df['ReqdExctnDt'][1], pd.Timestamp('2023-03-12T00:00:00Z')
+        )
+        self.assertEqual(len(logs.records), 3)
+        self.assertIn("P1: cannot read NbOfTxs 'x2'", logs.output[0])
+
+    def testParseMissingFile(self):
+        # Test that a missing file is reported when it is first parsed
+        parser = Pain001Parser('missing.xml')
+        with self.assertLogs('bankstatementparser.pain001_parser', 'ERROR'):
+            with self.assertRaises(FileNotFoundError):
+                parser.parse()
+
+    def testParseInvalidFile(self):
+        # Test that a file without a PAIN.001 group header is rejected
+        file_path = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            'test_data', 'invalid.xml'
+        )
+        with self.assertRaises(Pain001ParseError):
+            Pain001Parser(file_path).parse()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,11 @@
+import shutil
+import tempfile
 import unittest
+from unittest import mock
 from bankstatementparser.bank_statement_parsers import FileParserError
 from bankstatementparser.bank_statement_parsers import Pain001Parser
+from bankstatementparser.bank_statement_parsers import Camt053Parser
+from bankstatementparser.bank_statement_parsers import process_camt053_folder
 import os
 
 
@@ -11,14 +16,15 @@ class TestFileParserError(unittest.TestCase):
 
 
 class TestPain001Parser(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         current_dir = os.path.dirname(os.path.abspath(__file__))
         file_path = os.path.join(
             current_dir,
             'test_data',
             'pain.001.001.03.xml'
         )
-        self.parser = Pain001Parser(file_path)
+        cls.parser = Pain001Parser(file_path)
 
     def test_init(self):
         self.assertIsNotNone(self.parser)
@@ -26,7 +32,7 @@ class TestPain001Parser(unittest.TestCase):
 
         # Check attributes of the first batch
         first_batch = self.parser.batches[0]
-        pmt_inf_id = first_batch.find('.//PmtInfId')
+        pmt_inf_id = first_batch.find('.//{*}PmtInfId')
         self.assertIsNotNone(pmt_inf_id)
         self.assertEqual(pmt_inf_id.text, 'Payment-Info-12345')
 
@@ -39,6 +45,210 @@ class TestPain001Parser(unittest.TestCase):
         self.assertEqual(first_payment['Amount'], 150.0)
         self.assertEqual(first_payment['Currency'], 'EUR')
 
+    def test_empty_remittance_line(self):
+        xml = (
+            b'<Document><CstmrCdtTrfInitn><PmtInf><CdtTrfTxInf>'
+            b'<Amt><InstdAmt Ccy="EUR">10.00</InstdAmt></Amt>'
+            b'<Cdtr><Nm>Global Tech</Nm></Cdtr>'
+            b'<RmtInf><Ustrd/><Ustrd>Invoice 1</Ustrd></RmtInf>'
+            b'</CdtTrfTxInf></PmtInf></CstmrCdtTrfInitn></Document>'
+        )
+        with tempfile.NamedTemporaryFile(suffix='.xml') as f:
+            f.write(xml)
+            f.flush()
+            parser = Pain001Parser(f.name)
+
+        # An empty Ustrd element joins as an empty string
+        self.assertEqual(parser.payments[0]['Reference'], ' Invoice 1')
+
+
+class TestCamt053Parser(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        file_path = os.path.join(
+            current_dir,
+            'test_data',
+            'camt.053.001.02.xml'
+        )
+        cls.parser = Camt053Parser(file_path)
+
+    def test_init(self):
+        self.assertEqual(len(self.parser.statements), 1)
+        self.assertEqual(len(self.parser.transactions_df), 3)
+        self.assertEqual(
+            list(self.parser.transactions_df.columns),
+            list(Camt053Parser.TRANSACTION_COLUMNS)
+        )
+        self.assertEqual(
+            self.parser.transactions_df['Currency'].dtype, 'category'
+        )
+
+        # The transactions are also available as dictionaries
+        self.assertEqual(len(self.parser.transactions), 3)
+        transaction = self.parser.transactions[0]
+        self.assertEqual(
+            tuple(transaction), Camt053Parser.TRANSACTION_COLUMNS
+        )
+        self.assertIsInstance(transaction['Amount'], float)
+        self.assertEqual(transaction['StatementId'], 'AAAASESS-FP-STAT001')
+
+        # Check the statement summary built from the parsed transactions
+        statement = self.parser.statements[0]
+        self.assertEqual(statement['StatementId'], 'AAAASESS-FP-STAT001')
+        self.assertEqual(statement['AccountId'], '50000000054910000003')
+        self.assertEqual(statement['NumTransactions'], 3)
+        self.assertAlmostEqual(statement['TotalAmount'], -64321.5)
+        self.assertEqual(statement['OPBD']['Amount'], 500000.0)
+
+    def test_transaction_fields(self):
+        xml = (
+            b'<Document xmlns="urn:iso:std:iso:20022:tech:xsd:'
+            b'camt.053.001.02"><BkToCstmrStmt><Stmt><Id>STMT-1</Id>'
+            b'<Acct><Id><IBAN>SE0000000001</IBAN></Id></Acct>'
+            b'<Ntry><Amt Ccy="SEK">10.00</Amt><CdtDbtInd>DBIT</CdtDbtInd>'
+            b'<BookgDt><Dt>2010-10-18</Dt></BookgDt>'
+            b'<ValDt><Dt>2010-10-19</Dt></ValDt>'
+            b'<NtryDtls><TxDtls>'
+            b'<AmtDtls><TxAmt><Amt Ccy="EUR">1.00</Amt></TxAmt></AmtDtls>'
+            b'<RltdPties>'
+            b'<Dbtr><Nm>MUELLER</Nm></Dbtr>'
+            b'<DbtrAcct><Id><IBAN>SE0000000002</IBAN></Id></DbtrAcct>'
+            b'<Cdtr><Nm>SCHMIDT</Nm></Cdtr>'
+            b'<CdtrAcct><Id><Othr><Id>12345</Id></Othr></Id></CdtrAcct>'
+            b'</RltdPties>'
+            b'<RmtInf><Ustrd>Invoice 1</Ustrd><Ustrd>Invoice 2</Ustrd>'
+            b'</RmtInf>'
+            b'</TxDtls></NtryDtls></Ntry>'
+            b'<Ntry><Amt Ccy="SEK">20.00</Amt><CdtDbtInd>CRDT</CdtDbtInd>'
+            b'<ValDt><Dt>2010-10-20</Dt></ValDt></Ntry>'
+            b'</Stmt></BkToCstmrStmt></Document>'
+        )
+        with tempfile.NamedTemporaryFile(suffix='.xml') as f:
+            f.write(xml)
+            f.flush()
+            parser = Camt053Parser(f.name)
+
+        first, second = parser.transactions
+        self.assertEqual(first, {
+            'DebtorName': 'MUELLER',
+            'DebtorAccount': 'SE0000000002',
+            'CreditorName': 'SCHMIDT',
+            'CreditorAccount': '12345',
+            'Amount': -10.0,
+            'Currency': 'SEK',
+            'CreditDebit': 'DBIT',
+            'Reference': 'Invoice 1 Invoice 2',
+            'ValueDate': '2010-10-19',
+            'BookingDate': '2010-10-18',
+            'StatementId': 'STMT-1'
+        })
+
+        # An entry without details has empty parties and no reference
+        self.assertEqual(second, {
+            'DebtorName': '',
+            'DebtorAccount': '',
+            'CreditorName': '',
+            'CreditorAccount': '',
+            'Amount': 20.0,
+            'Currency': 'SEK',
+            'CreditDebit': 'CRDT',
+            'Reference': '',
+            'ValueDate': '2010-10-20',
+            'BookingDate': None,
+            'StatementId': 'STMT-1'
+        })
+
+    def test_missing_dates(self):
+        xml = (
+            b'<Document><BkToCstmrStmt><Stmt><Id>STMT-1</Id>'
+            b'<Acct><Id><IBAN>SE0000000001</IBAN></Id></Acct>'
+            b'<Ntry><Amt Ccy="SEK">10.00</Amt><CdtDbtInd>CRDT</CdtDbtInd>'
+            b'<BookgDt><Dt>2010-10-18</Dt></BookgDt>'
+            b'<ValDt><Dt>2010-10-19</Dt></ValDt></Ntry>'
+            b'<Ntry><Amt Ccy="SEK">20.00</Amt><CdtDbtInd>DBIT</CdtDbtInd>'
+            b'</Ntry>'
+            b'</Stmt></BkToCstmrStmt></Document>'
+        )
+        with tempfile.NamedTemporaryFile(suffix='.xml') as f:
+            f.write(xml)
+            f.flush()
+            parser = Camt053Parser(f.name)
+
+        # Dates missing from an entry are None, not NaN
+        first, second = parser.transactions
+        self.assertEqual(first['BookingDate'], '2010-10-18')
+        self.assertEqual(first['ValueDate'], '2010-10-19')
+        self.assertIsNone(second['BookingDate'])
+        self.assertIsNone(second['ValueDate'])
+        self.assertEqual(second['Amount'], -20.0)
+        self.assertEqual(second['DebtorName'], '')
+
+
+class TestProcessCamt053Folder(unittest.TestCase):
+    def test_process_folder(self):
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        folder = os.path.join(current_dir, 'test_data')
+        with mock.patch(
+            'bankstatementparser.bank_statement_parsers.ProcessPoolExecutor'
+        ) as executor:
+            files_df, statements_df, transactions_df = (
+                process_camt053_folder(folder)
+            )
+
+        # Worker processes are only used when asked for.
+        executor.assert_not_called()
+
+        # Only the CAMT.053 file parses; every other file is reported.
+        self.assertEqual(len(files_df), len(os.listdir(folder)))
+        succeeded = files_df[files_df['Status'] == 'Success']
+        self.assertEqual(
+            list(succeeded['FileName']), ['camt.053.001.02.xml']
+        )
+        self.assertEqual(len(statements_df), 1)
+        self.assertEqual(len(transactions_df), 3)
+        self.assertEqual(list(transactions_df.index), [0, 1, 2])
+
+    def test_package_attribute(self):
+        # The submodule is reachable as an attribute of the package
+        import bankstatementparser
+        self.assertIs(
+            bankstatementparser.bank_statement_parsers.process_camt053_folder,
+            process_camt053_folder
+        )
+
+    def test_process_folder_parallel_matches_serial(self):
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        folder = os.path.join(current_dir, 'test_data')
+        parallel = process_camt053_folder(folder, max_workers=2)
+        serial = process_camt053_folder(folder, max_workers=1)
+
+        # Parsing in worker processes gives the same results as parsing
+        # in the calling process.
+        for parallel_df, serial_df in zip(parallel, serial):
+            self.assertTrue(parallel_df.equals(serial_df))
+
+    def test_process_folder_combines_files(self):
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        file_path = os.path.join(
+            current_dir, 'test_data', 'camt.053.001.02.xml'
+        )
+        with tempfile.TemporaryDirectory() as folder:
+            for name in ('a.xml', 'b.xml'):
+                shutil.copy(file_path, os.path.join(folder, name))
+            _, statements_df, transactions_df = process_camt053_folder(
+                folder, max_workers=1
+            )
+
+        # Both files' transactions are combined with the parser's schema
+        self.assertEqual(len(statements_df), 2)
+        self.assertEqual(list(transactions_df.index), list(range(6)))
+        self.assertEqual(
+            list(transactions_df.columns),
+            list(Camt053Parser.TRANSACTION_COLUMNS)
+        )
+        self.assertEqual(transactions_df['Currency'].dtype, 'category')
+
 
 if __name__ == '__main__':
     unittest.main()
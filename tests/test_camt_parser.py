@@ -4,20 +4,38 @@ import os
 
 
 class TestCamtParser(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         current_dir = os.path.dirname(os.path.abspath(__file__))
         file_path = os.path.join(
             current_dir,
             'test_data',
             'camt.053.001.02.xml'
         )
-        self.parser = CamtParser(file_path)
+        cls.parser = CamtParser(file_path)
 
     def test_init(self):
         self.assertIsNotNone(self.parser)
-        self.assertIsNotNone(self.parser.tree)
+        self.assertTrue(self.parser.file_name.endswith('.xml'))
         self.assertIsInstance(self.parser.definitions, dict)
 
+    def test_single_parse(self):
+        transactions = self.parser.get_transactions()
+        stats = self.parser.get_statement_stats()
+
+        # Every view comes from the same memoized parse
+        self.assertIs(self.parser._parse_all(), self.parser._parse_all())
+        self.assertEqual(len(transactions), 3)
+        self.assertEqual(stats['NumTransactions'].sum(), len(transactions))
+        self.assertEqual(len(self.parser.get_account_balances()), 2)
+
+    def test_missing_file(self):
+        # A missing file is reported when data is first requested
+        parser = CamtParser('missing.xml')
+        with self.assertLogs('bankstatementparser.camt_parser', 'ERROR'):
+            with self.assertRaises(FileNotFoundError):
+                parser.get_transactions()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,12 @@
 
+import importlib.util
+import io
+import os
+import tempfile
 import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+import pandas as pd
 from bankstatementparser.cli import BankStatementCLI
 
 
@@ -11,6 +18,44 @@ class TestBankStatementCLI(unittest.TestCase):
         self.assertIsNotNone(self.cli)
         self.assertIsNotNone(self.cli.parser)
 
+    def test_run_help(self):
+        output = io.StringIO()
+        with mock.patch('sys.argv', ['cli.py', '--type', 'camt', '--help']):
+            with redirect_stdout(output), self.assertRaises(SystemExit) as cm:
+                self.cli.run()
+
+        # Help is printed and the CLI exits successfully
+        self.assertEqual(cm.exception.code, 0)
+        self.assertIn('--input', output.getvalue())
+
+    def test_save_output_csv(self):
+        # More rows than one CSV chunk, with text and float columns
+        data_df = pd.DataFrame({
+            'Reference': [f'Ref {i}' for i in range(70000)],
+            'Amount': [i / 4 for i in range(70000)]
+        })
+        with tempfile.TemporaryDirectory() as folder:
+            output_path = os.path.join(folder, 'out.csv')
+            self.cli.save_output(data_df, output_path)
+            saved_df = pd.read_csv(output_path)
+
+        pd.testing.assert_frame_equal(saved_df, data_df)
+
+    @unittest.skipUnless(
+        importlib.util.find_spec('pyarrow'), 'pyarrow not installed'
+    )
+    def test_save_output_parquet(self):
+        data_df = pd.DataFrame({
+            'Currency': pd.Categorical(['EUR', 'SEK', 'EUR']),
+            'Amount': [1.5, -2.25, 3.0]
+        })
+        with tempfile.TemporaryDirectory() as folder:
+            output_path = os.path.join(folder, 'out.parquet')
+            self.cli.save_output(data_df, output_path)
+            saved_df = pd.read_parquet(output_path)
+
+        pd.testing.assert_frame_equal(saved_df, data_df)
+
 
 if __name__ == '__main__':
     unittest.main()